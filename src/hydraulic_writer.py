@@ -0,0 +1,140 @@
+"""水理量の時系列テキスト出力。
+
+1 ステップを 1 行 (時刻 + 観測点ごとの値) とする独自のテキスト形式で書き出す。
+sample_cgns/rriresultviewer/hydraulicdata 配下の .dat はバイナリであり、
+この形式とは互換性がない (rriresultviewer での読み込みは確認していない)。
+
+ファイルはクローズまで開いたままにし、整形済みの行を内部バッファに溜めて
+一定サイズを超えた時点でまとめて書き込む。
+"""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+DEFAULT_FLOAT_FORMAT = "%.3f"
+DEFAULT_BUFFER_SIZE = 1 << 20
+# float_format / time_format に指定できる書式 (% 形式の浮動小数点変換 1 つのみ)
+_FLOAT_FORMAT_RE = re.compile(r"%[-+ #0]*\d*(?:\.\d+)?[eEfFgG]")
+
+
+def _as_list(values: Any) -> list:
+    # numpy 配列は tolist() で Python のスカラーに変換してから整形する
+    if hasattr(values, "tolist"):
+        return values.tolist()
+    return list(values)
+
+
+class HydraulicDataWriter:
+    """時系列データをテキストとして追記するライタ。
+
+    Args:
+        path: 出力ファイルのパス。親ディレクトリが無ければ作成する。
+        columns: 1 ステップあたりの値の数 (観測点数)。
+        float_format: 値の書式。%e / %f / %g 系の変換 1 つ (例: "%.3f", "%12.6e")。
+        time_format: 時刻の書式。float_format と同じ制約。省略時は float_format と同じ。
+        separator: 列区切り文字。
+        header: 先頭行に書き出す列名。append=True で既存ファイルに追記する場合は書かない。
+        append: True の場合は既存ファイルの末尾に追記する。
+        buffer_size: 内部バッファをファイルへ書き出す閾値 (文字数)。
+        encoding: 出力ファイルのエンコーディング。
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        columns: int,
+        float_format: str = DEFAULT_FLOAT_FORMAT,
+        time_format: str | None = None,
+        separator: str = " ",
+        header: Sequence[str] | None = None,
+        append: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        encoding: str = "utf-8",
+    ) -> None:
+        if columns < 1:
+            raise ValueError(f"columns は 1 以上で指定してください: {columns}")
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size は 1 以上で指定してください: {buffer_size}")
+        time_format = time_format or float_format
+        for fmt in (float_format, time_format):
+            if not _FLOAT_FORMAT_RE.fullmatch(fmt):
+                raise ValueError(f"書式が不正です (%e / %f / %g 系のみ): {fmt!r}")
+        names = None
+        if header is not None:
+            names = list(header)
+            if len(names) != columns + 1:
+                raise ValueError(f"header の列数が一致しません: {len(names)} != {columns + 1}")
+
+        self.path = Path(path)
+        self.columns = columns
+        self._row_format = separator.join([time_format] + [float_format] * columns) + "\n"
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._buffer_size = buffer_size
+
+        write_header = names is not None and not (append and self.path.exists())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if append else "w", encoding=encoding, newline="\n")
+        if write_header:
+            self._push([separator.join(names) + "\n"])
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write_step(self, time: float, values: Iterable[float]) -> None:
+        """1 ステップ分の値を追記する。"""
+        self.write_steps([time], [values])
+
+    def write_steps(self, times: Iterable[float], values: Iterable[Iterable[float]]) -> None:
+        """複数ステップ分の値 (ステップ数 x 観測点数) を追記する。
+
+        全行の検証と整形が済んでから書き込むため、例外時は何も追記されない。
+        """
+        times_list = _as_list(times)
+        rows = [_as_list(row) for row in _as_list(values)]
+        if len(times_list) != len(rows):
+            raise ValueError(f"時刻と値の行数が一致しません: {len(times_list)} != {len(rows)}")
+        for i, row in enumerate(rows):
+            if len(row) != self.columns:
+                raise ValueError(f"値の数が一致しません (行 {i}): {len(row)} != {self.columns}")
+        try:
+            lines = [self._row_format % (t, *row) for t, row in zip(times_list, rows)]
+        except TypeError as exc:
+            raise ValueError(f"数値以外の値が含まれています: {exc}") from exc
+        self._push(lines)
+
+    def flush(self) -> None:
+        """内部バッファをファイルへ書き出す。"""
+        self._drain()
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+    def _push(self, lines: list[str]) -> None:
+        if self._file.closed:
+            raise ValueError(f"ファイルは既に閉じられています: {self.path}")
+        self._buffer.extend(lines)
+        self._buffered += sum(len(line) for line in lines)
+        if self._buffered >= self._buffer_size:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._buffer:
+            self._file.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+    def __enter__(self) -> HydraulicDataWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
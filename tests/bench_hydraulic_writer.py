@@ -0,0 +1,95 @@
+"""hydraulic_writer のスループット計測。
+
+ステップごとにファイルを開き値ごとに write する素朴な実装と、
+HydraulicDataWriter の write_step / write_steps を比較する。
+高速化はファイルを開いたままにすることと書き込みのバッファリングによるもので、
+write_steps は write_step の繰り返しと同等の速度になる。
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from hydraulic_writer import DEFAULT_FLOAT_FORMAT, HydraulicDataWriter  # noqa: E402
+
+
+def _make_data(steps: int, gauges: int) -> tuple[list[float], list[list[float]]]:
+    # 乱数で水位相当の値を生成する
+    rng = random.Random(0)
+    times = [float(i) * 60.0 for i in range(steps)]
+    values = [[rng.uniform(0.0, 100.0) for _ in range(gauges)] for _ in range(steps)]
+    return times, values
+
+
+def _write_naive(path: Path, times: list[float], values: list[list[float]], float_format: str) -> None:
+    # 比較用: ステップごとにファイルを開き、値ごとに書式化して書き込む
+    path.write_text("", encoding="utf-8")
+    for t, row in zip(times, values):
+        with open(path, "a", encoding="utf-8", newline="\n") as f:
+            f.write(float_format % t)
+            for v in row:
+                f.write(" ")
+                f.write(float_format % v)
+            f.write("\n")
+
+
+def _write_per_step(path: Path, times: list[float], values: list[list[float]], float_format: str) -> None:
+    with HydraulicDataWriter(path, len(values[0]), float_format=float_format) as writer:
+        for t, row in zip(times, values):
+            writer.write_step(t, row)
+
+
+def _write_bulk(path: Path, times: list[float], values: list[list[float]], float_format: str) -> None:
+    with HydraulicDataWriter(path, len(values[0]), float_format=float_format) as writer:
+        writer.write_steps(times, values)
+
+
+def main() -> int:
+    # データ生成 -> 各方式で書き出し -> 時間と出力一致を表示
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--gauges", type=int, default=1000)
+    parser.add_argument("--float-format", default=DEFAULT_FLOAT_FORMAT)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    times, values = _make_data(args.steps, args.gauges)
+    total = args.steps * args.gauges
+    methods = [
+        ("naive", _write_naive),
+        ("write_step", _write_per_step),
+        ("write_steps", _write_bulk),
+    ]
+
+    print(f"steps={args.steps} gauges={args.gauges} format={args.float_format!r}")
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs: dict[str, bytes] = {}
+        baseline = None
+        for name, func in methods:
+            path = Path(tmp) / f"{name}.dat"
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                func(path, times, values, args.float_format)
+                best = min(best, time.perf_counter() - start)
+            outputs[name] = path.read_bytes()
+            if baseline is None:
+                baseline = best
+            rate = total / best / 1e6
+            print(f"{name:>12}: {best:8.3f} s  {rate:7.2f} Mvalues/s  x{baseline / best:5.2f}")
+
+    reference = outputs["naive"]
+    mismatched = [name for name, data in outputs.items() if data != reference]
+    if mismatched:
+        print(f"出力が一致しません: {', '.join(mismatched)}", file=sys.stderr)
+        return 1
+    print("出力一致: OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
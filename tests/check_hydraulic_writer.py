@@ -0,0 +1,143 @@
+"""hydraulic_writer の動作確認。
+
+一時ディレクトリに書き出したファイルの内容を期待値と比較する。
+numpy が無い環境では numpy 入力の確認のみスキップする。
+"""
+import difflib
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from hydraulic_writer import HydraulicDataWriter  # noqa: E402
+
+
+def _assert_text(path: Path, expected: str) -> None:
+    # ファイル内容を期待値と比較し、不一致なら diff を表示する
+    actual = path.read_text(encoding="utf-8")
+    if actual != expected:
+        diff = "".join(
+            difflib.unified_diff(
+                expected.splitlines(keepends=True),
+                actual.splitlines(keepends=True),
+                "expected",
+                str(path),
+            )
+        )
+        raise AssertionError(f"内容が一致しません:\n{diff}")
+
+
+def _assert_raises(exc_type: type[BaseException], func: Callable[[], object]) -> None:
+    try:
+        func()
+    except exc_type:
+        return
+    raise AssertionError(f"{exc_type.__name__} が送出されません")
+
+
+def check_header_and_formats(tmp: Path) -> None:
+    path = tmp / "sub" / "wse.dat"
+    with HydraulicDataWriter(
+        path, 2, float_format="%.2f", time_format="%g", header=["t", "g1", "g2"]
+    ) as writer:
+        writer.write_step(0, [1, 2])
+        writer.write_steps([60, 120], [[3, 4], (5, 6)])
+    _assert_text(path, "t g1 g2\n0 1.00 2.00\n60 3.00 4.00\n120 5.00 6.00\n")
+
+
+def check_append(tmp: Path) -> None:
+    path = tmp / "append.dat"
+    path.write_text("t a b\n0.000 1.000 2.000\n", encoding="utf-8")
+    with HydraulicDataWriter(path, 2, header=["t", "a", "b"], append=True) as writer:
+        writer.write_step(1.0, [3.0, 4.0])
+    _assert_text(path, "t a b\n0.000 1.000 2.000\n1.000 3.000 4.000\n")
+    # 追記で新規作成する場合はヘッダを書く
+    new_path = tmp / "append_new.dat"
+    with HydraulicDataWriter(new_path, 1, header=["t", "a"], append=True) as writer:
+        writer.write_step(0.0, [1.0])
+    _assert_text(new_path, "t a\n0.000 1.000\n")
+
+
+def check_numpy_input(tmp: Path) -> None:
+    try:
+        import numpy as np
+    except ImportError:
+        print("  numpy が無いためスキップ")
+        return
+    path = tmp / "numpy.dat"
+    with HydraulicDataWriter(path, 3, float_format="%.1f") as writer:
+        writer.write_step(np.float64(0.0), np.array([1.0, 2.0, 3.0]))
+        writer.write_steps(np.array([1.0, 2.0]), np.arange(6, dtype=np.float32).reshape(2, 3))
+    _assert_text(path, "0.0 1.0 2.0 3.0\n1.0 0.0 1.0 2.0\n2.0 3.0 4.0 5.0\n")
+
+
+def check_invalid_arguments_keep_file(tmp: Path) -> None:
+    path = tmp / "keep.dat"
+    path.write_text("precious\n", encoding="utf-8")
+    _assert_raises(ValueError, lambda: HydraulicDataWriter(path, 2, header=["t", "a"]))
+    _assert_raises(ValueError, lambda: HydraulicDataWriter(path, 2, header=["t"], append=True))
+    for fmt in ("%d", "%s", "%r", "%.3f m", "%f%f", "f"):
+        _assert_raises(ValueError, lambda: HydraulicDataWriter(path, 2, float_format=fmt))
+    _assert_raises(ValueError, lambda: HydraulicDataWriter(path, 2, time_format="%d"))
+    _assert_raises(ValueError, lambda: HydraulicDataWriter(path, 0))
+    _assert_text(path, "precious\n")
+
+
+def check_invalid_rows_keep_file(tmp: Path) -> None:
+    path = tmp / "rows.dat"
+    with HydraulicDataWriter(path, 2, buffer_size=1) as writer:
+        writer.write_step(0.0, [1.0, 2.0])
+        _assert_raises(ValueError, lambda: writer.write_step(1.0, [1.0]))
+        _assert_raises(ValueError, lambda: writer.write_step(1.0, ["x", 2.0]))
+        _assert_raises(ValueError, lambda: writer.write_steps([1.0], [[1.0, 2.0], [3.0, 4.0]]))
+        # 後方の行の不正でも前方の行は書き込まれない
+        rows = [[float(i), float(i)] for i in range(70000)]
+        rows[-1] = [1.0]
+        _assert_raises(ValueError, lambda: writer.write_steps(range(70000), rows))
+        writer.flush()
+        _assert_text(path, "0.000 1.000 2.000\n")
+
+
+def check_close(tmp: Path) -> None:
+    path = tmp / "close.dat"
+    writer = HydraulicDataWriter(path, 1)
+    writer.write_step(0.0, [1.0])
+    _assert_text(path, "")
+    writer.flush()
+    _assert_text(path, "0.000 1.000\n")
+    writer.close()
+    writer.close()
+    assert writer.closed
+    _assert_raises(ValueError, lambda: writer.write_step(1.0, [2.0]))
+    _assert_text(path, "0.000 1.000\n")
+
+
+def main() -> int:
+    checks = [
+        check_header_and_formats,
+        check_append,
+        check_numpy_input,
+        check_invalid_arguments_keep_file,
+        check_invalid_rows_keep_file,
+        check_close,
+    ]
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for check in checks:
+            print(check.__name__)
+            try:
+                check(Path(tmp))
+            except AssertionError as exc:
+                failed += 1
+                print(f"  NG: {exc}", file=sys.stderr)
+    if failed:
+        print(f"{failed} 件失敗", file=sys.stderr)
+        return 1
+    print("すべて OK")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())